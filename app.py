@@ -1,18 +1,22 @@
 # app.py
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from flask_jwt_extended import (
-    JWTManager,
-    create_access_token,
-    jwt_required,
-    get_jwt_identity,
-)
+from quart import Quart, g, request, jsonify
+from quart.json.provider import JSONProvider
+from quart_cors import cors
+import asyncio
 import bcrypt
+import functools
+import hashlib
+import jwt
+import msgspec
+import orjson
 import os
 import sqlite3
+import threading
 import time
-from uuid import uuid4
-from datetime import date, timedelta
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
 
 ENGINE_OK = True
 ENGINE_IMPORT_ERROR = ""
@@ -25,157 +29,592 @@ try:
         workload_text_bars,
         gpa_impact_estimates,
         dashboard_summary,
+        assignments_to_arrays,
     )
 except Exception as e:
     ENGINE_OK = False
     ENGINE_IMPORT_ERROR = str(e)
+else:
+    # Pure and low-cardinality (due dates repeat across rows and users), and
+    # date objects are immutable, so memoized results are safe to share.
+    @functools.lru_cache(maxsize=8192)
+    def _parse_date(due_date: str) -> Optional[date]:
+        """parse_date, but None for a malformed string (cached like a hit)."""
+        try:
+            return parse_date(due_date)
+        except ValueError:
+            return None
 
 BASE_DIR = os.path.dirname(__file__)
-DB_PATH = os.path.join(BASE_DIR, "studentos.db")
+DB_PATH = os.environ.get("DB_PATH", os.path.join(BASE_DIR, "studentos.db"))
+
+# Blocking work (SQLite, bcrypt) runs on the event loop's default executor.
+WORKER_THREADS = int(os.environ.get("WORKER_THREADS", "64"))
+
+# How long a successful password check is remembered (seconds).
+LOGIN_CACHE_TTL = 60.0
+LOGIN_CACHE_MAX = 4096
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    jsonify() and request.get_json() backed by orjson. Responses are built
+    straight from orjson's UTF-8 bytes, skipping the str round-trip.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode("utf-8")
 
-app = Flask(__name__)
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
 app.config["JWT_SECRET_KEY"] = os.environ.get("JWT_SECRET_KEY", "dev-secret-change-me")
 app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(days=30)
 
-jwt = JWTManager(app)
-
-CORS(
+cors(
     app,
-    resources={r"/*": {"origins": "*"}},
+    allow_origin="*",
     allow_headers=["Content-Type", "Authorization"],
-    methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
 )
 
 
+@app.before_serving
+async def configure_executor():
+    # asyncio.to_thread() defaults to min(32, cpu + 4) threads, which a burst
+    # of logins (bcrypt) can exhaust and stall every DB-backed route behind it.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=WORKER_THREADS)
+    )
+
+
+# ----------------------------
+# JWT auth
+# ----------------------------
+# HS256 tokens on PyJWT directly, with the claims flask-jwt-extended 4.x
+# issued (identity in "sub", "type": "access"), so tokens from before the
+# Quart port stay valid. Errors keep its {"msg": ...} bodies: 401 for a
+# missing or expired token, 422 for a malformed or invalid one.
+
+JWT_ALGORITHM = "HS256"
+
+
+def create_access_token(identity: str) -> str:
+    now = datetime.now(timezone.utc)
+    claims = {
+        "fresh": False,
+        "iat": now,
+        "jti": str(uuid.uuid4()),
+        "type": "access",
+        "sub": identity,
+        "nbf": now,
+        "exp": now + app.config["JWT_ACCESS_TOKEN_EXPIRES"],
+    }
+    return jwt.encode(claims, app.config["JWT_SECRET_KEY"], algorithm=JWT_ALGORITHM)
+
+
+def jwt_required(view):
+    """
+    Runs the view only for "Authorization: Bearer <token>" carrying a
+    valid, unexpired access token; get_jwt_identity() is its "sub".
+    """
+    @functools.wraps(view)
+    async def wrapper(*args, **kwargs):
+        header = request.headers.get("Authorization")
+        if not header:
+            return jsonify({"msg": "Missing Authorization Header"}), 401
+
+        parts = header.split()
+        if len(parts) != 2 or parts[0] != "Bearer":
+            return jsonify({"msg": "Bad Authorization header. Expected value 'Bearer <JWT>'"}), 422
+
+        try:
+            claims = jwt.decode(
+                parts[1],
+                app.config["JWT_SECRET_KEY"],
+                algorithms=[JWT_ALGORITHM],
+                options={"require": ["exp", "sub"]},
+            )
+        except jwt.ExpiredSignatureError:
+            return jsonify({"msg": "Token has expired"}), 401
+        except jwt.InvalidTokenError as e:
+            return jsonify({"msg": str(e)}), 422
+
+        if claims.get("type", "access") != "access":
+            return jsonify({"msg": "Only access tokens are allowed"}), 422
+
+        g.jwt_identity = claims["sub"]
+        return await view(*args, **kwargs)
+
+    return wrapper
+
+
+def get_jwt_identity() -> str:
+    return g.jwt_identity
+
+
 # ----------------------------
 # DB Setup
 # ----------------------------
 
-def get_db():
-    conn = sqlite3.connect(DB_PATH)
+_local = threading.local()
+_open_connections = []
+_open_connections_lock = threading.Lock()
+
+
+def _connect():
+    # Room for every fixed statement below plus update_assignment's variants
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
     conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-20000;
+    """)
     return conn
 
 
-def init_db():
-    with get_db() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                username   TEXT PRIMARY KEY,
-                password   TEXT NOT NULL
-            )
-        """)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS courses (
-                id         TEXT PRIMARY KEY,
-                username   TEXT NOT NULL,
-                name       TEXT NOT NULL,
-                color      TEXT NOT NULL DEFAULT '#4f7cff',
-                created_at INTEGER NOT NULL DEFAULT 0
-            )
-        """)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS assignments (
-                id             TEXT PRIMARY KEY,
-                username       TEXT NOT NULL,
-                name           TEXT NOT NULL,
-                course_id      TEXT DEFAULT NULL,
-                weight_percent REAL NOT NULL DEFAULT 0,
-                due_date       TEXT NOT NULL DEFAULT '',
-                confidence     INTEGER NOT NULL DEFAULT 3,
-                est_hours      REAL NOT NULL DEFAULT 0,
-                hours_logged   REAL NOT NULL DEFAULT 0,
-                completed      INTEGER NOT NULL DEFAULT 0,
-                created_at     INTEGER NOT NULL DEFAULT 0
-            )
-        """)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS user_settings (
-                username         TEXT PRIMARY KEY,
-                current_grade    REAL NOT NULL DEFAULT 85.0,
-                onboarded        INTEGER NOT NULL DEFAULT 0
-            )
-        """)
+def get_db():
+    """
+    Connection owned by the calling thread, opened on first use and reused
+    for every later query that lands on the same executor thread.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = _connect()
+        with _open_connections_lock:
+            _open_connections.append(conn)
+    return conn
+
+
+def close_db():
+    with _open_connections_lock:
+        for conn in _open_connections:
+            conn.close()
+        _open_connections.clear()
+
 
-        # Migrations
-        for migration in [
-            "ALTER TABLE assignments ADD COLUMN hours_logged REAL NOT NULL DEFAULT 0",
-            "ALTER TABLE assignments ADD COLUMN completed INTEGER NOT NULL DEFAULT 0",
-            "ALTER TABLE assignments ADD COLUMN course_id TEXT DEFAULT NULL",
-            "ALTER TABLE user_settings ADD COLUMN onboarded INTEGER NOT NULL DEFAULT 0",
-        ]:
-            try:
-                conn.execute(migration)
-            except Exception:
-                pass
+# Bump whenever init_db() gains a table, column, or index; databases
+# stamped with this version skip the schema work entirely on startup.
+SCHEMA_VERSION = 1
 
-        conn.commit()
+# (table, column, column definition) added after the table first shipped
+MIGRATIONS = [
+    ("assignments", "hours_logged", "REAL NOT NULL DEFAULT 0"),
+    ("assignments", "completed", "INTEGER NOT NULL DEFAULT 0"),
+    ("assignments", "course_id", "TEXT DEFAULT NULL"),
+    ("user_settings", "onboarded", "INTEGER NOT NULL DEFAULT 0"),
+    ("user_settings", "revision", "INTEGER NOT NULL DEFAULT 0"),
+]
+
+
+def _create_schema(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            username   TEXT PRIMARY KEY,
+            password   TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS courses (
+            id         TEXT PRIMARY KEY,
+            username   TEXT NOT NULL,
+            name       TEXT NOT NULL,
+            color      TEXT NOT NULL DEFAULT '#4f7cff',
+            created_at INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS assignments (
+            id             TEXT PRIMARY KEY,
+            username       TEXT NOT NULL,
+            name           TEXT NOT NULL,
+            course_id      TEXT DEFAULT NULL,
+            weight_percent REAL NOT NULL DEFAULT 0,
+            due_date       TEXT NOT NULL DEFAULT '',
+            confidence     INTEGER NOT NULL DEFAULT 3,
+            est_hours      REAL NOT NULL DEFAULT 0,
+            hours_logged   REAL NOT NULL DEFAULT 0,
+            completed      INTEGER NOT NULL DEFAULT 0,
+            created_at     INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS user_settings (
+            username         TEXT PRIMARY KEY,
+            current_grade    REAL NOT NULL DEFAULT 85.0,
+            onboarded        INTEGER NOT NULL DEFAULT 0,
+            revision         INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    # Migrations
+    columns = {}
+    for table, column, definition in MIGRATIONS:
+        if table not in columns:
+            columns[table] = {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns[table]:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    # Indexes (after migrations so every indexed column exists)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_assign_user_created ON assignments(username, created_at DESC)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_courses_user_created ON courses(username, created_at)"
+    )
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def init_db():
+    conn = _connect()
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        conn.close()
+        return
+
+    with conn:
+        # Every hypercorn worker imports the app at once, and sqlite3 runs
+        # DDL outside a transaction; take the write lock so exactly one of
+        # them creates/migrates and the rest see the stamped version.
+        conn.execute("BEGIN IMMEDIATE")
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            _create_schema(conn)
+    conn.close()
 
 
 init_db()
 
 
+@app.after_serving
+async def shutdown_db():
+    close_db()
+
+
+# ----------------------------
+# SQL
+# ----------------------------
+# Fixed statements live here so every call site passes the identical
+# string and hits the connection's prepared-statement cache.
+
+SQL_LIST_OPEN_ASSIGN = """
+    SELECT name, weight_percent, due_date, confidence, est_hours, hours_logged
+    FROM assignments
+    WHERE username = ? AND completed = 0
+    ORDER BY created_at DESC
+"""
+
+SQL_BUMP_REVISION = """
+    INSERT INTO user_settings (username, revision)
+    VALUES (?, 1)
+    ON CONFLICT(username) DO UPDATE SET revision = revision + 1
+"""
+
+SQL_GET_REVISION = "SELECT revision FROM user_settings WHERE username = ?"
+
+SQL_GET_DASHBOARD_KEY = "SELECT revision, current_grade FROM user_settings WHERE username = ?"
+
+SQL_GET_GRADE = "SELECT current_grade FROM user_settings WHERE username = ?"
+
+SQL_UPSERT_GRADE = """
+    INSERT INTO user_settings (username, current_grade)
+    VALUES (?, ?)
+    ON CONFLICT(username) DO UPDATE SET current_grade = excluded.current_grade
+"""
+
+SQL_GET_ONBOARDED = "SELECT onboarded FROM user_settings WHERE username = ?"
+
+SQL_USER_EXISTS = "SELECT username FROM users WHERE username = ?"
+
+SQL_INSERT_USER = "INSERT INTO users (username, password) VALUES (?, ?)"
+
+SQL_GET_PASSWORD = "SELECT password FROM users WHERE username = ?"
+
+SQL_LIST_COURSES = "SELECT * FROM courses WHERE username = ? ORDER BY created_at ASC"
+
+SQL_INSERT_COURSE = "INSERT INTO courses (id, username, name, color, created_at) VALUES (?, ?, ?, ?, ?)"
+
+SQL_UNLINK_COURSE = "UPDATE assignments SET course_id = NULL WHERE course_id = ? AND username = ?"
+
+SQL_DEL_COURSE = "DELETE FROM courses WHERE id = ? AND username = ?"
+
+SQL_LIST_ASSIGN = """
+    SELECT id, name, course_id, weight_percent, due_date, confidence,
+           est_hours, hours_logged, completed, created_at
+    FROM assignments
+    WHERE username = ?
+    ORDER BY created_at DESC
+"""
+
+SQL_INSERT_ASSIGN = """
+    INSERT INTO assignments
+        (id, username, name, course_id, weight_percent, due_date, confidence, est_hours, hours_logged, completed, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, 0, ?)
+"""
+
+SQL_COMPLETE_ASSIGN = "UPDATE assignments SET completed = 1 WHERE id = ? AND username = ?"
+
+# RETURNING (SQLite 3.35+) folds the read-modify-write into one statement
+SQL_LOG_HOURS = """
+    UPDATE assignments SET hours_logged = hours_logged + ?
+    WHERE id = ? AND username = ?
+    RETURNING hours_logged
+"""
+
+SQL_DEL_ASSIGN = "DELETE FROM assignments WHERE id = ? AND username = ?"
+
+SQL_ENSURE_SETTINGS = """
+    INSERT INTO user_settings (username, current_grade, onboarded)
+    VALUES (?, 85.0, 0)
+    ON CONFLICT(username) DO NOTHING
+"""
+
+SQL_SET_GRADE = "UPDATE user_settings SET current_grade = ? WHERE username = ?"
+
+SQL_SET_ONBOARDED = "UPDATE user_settings SET onboarded = ? WHERE username = ?"
+
+
 # ----------------------------
 # Helpers
 # ----------------------------
 
+def _tuple_cursor(conn):
+    """
+    Cursor returning plain tuples instead of sqlite3.Row, for the hot
+    list queries where rows are unpacked positionally anyway.
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+
+def _with_validators(response, etag: str, no_cache: bool = False):
+    """
+    ETag and Cache-Control for a per-user route. A 304 must carry the same
+    ones its 200 would, so both go through here.
+    """
+    response.set_etag(etag)
+    response.cache_control.private = True
+    if no_cache:
+        response.cache_control.no_cache = True
+    return response
+
+
+def _not_modified(etag: str, no_cache: bool = False):
+    """
+    The 304 for a request whose If-None-Match matched etag. Comparison is
+    weak (RFC 9110 13.1.2), so W/"..." from a proxy that re-encoded the
+    body still matches.
+    """
+    response = app.response_class(status=304)
+    # no body, so no Content-Type (response_class would default to text/html)
+    del response.headers["Content-Type"]
+    return _with_validators(response, etag, no_cache)
+
+
 def _load_user_assignments(username: str):
-    with get_db() as conn:
-        rows = conn.execute(
-            "SELECT * FROM assignments WHERE username = ? AND completed = 0 ORDER BY created_at DESC",
-            (username,)
-        ).fetchall()
+    rows = _tuple_cursor(get_db()).execute(SQL_LIST_OPEN_ASSIGN, (username,)).fetchall()
 
+    # Every column is NOT NULL and typed on write, so only the due date
+    # (free text from the client, '' when unset) needs checking per row.
     assignments = []
-    for row in rows:
-        try:
-            remaining = max(0.0, float(row["est_hours"]) - float(row["hours_logged"]))
-            assignments.append(Assignment(
-                name=str(row["name"]),
-                weight_percent=float(row["weight_percent"]),
-                due_date=parse_date(str(row["due_date"])),
-                confidence=int(row["confidence"]),
-                estimated_hours=remaining,
-            ))
-        except Exception:
-            pass
+    for name, weight_percent, due_date, confidence, est_hours, hours_logged in rows:
+        if not due_date:
+            continue
+        due = _parse_date(due_date)
+        if due is None:
+            app.logger.warning(
+                "skipping assignment %r for %s: bad due date %r", name, username, due_date
+            )
+            continue
+        assignments.append(Assignment(
+            name=name,
+            weight_percent=weight_percent,
+            due_date=due,
+            confidence=confidence,
+            estimated_hours=max(0.0, est_hours - hours_logged),
+        ))
     return assignments
 
 
-def _get_user_grade(username: str) -> float:
-    with get_db() as conn:
-        row = conn.execute(
-            "SELECT current_grade FROM user_settings WHERE username = ?",
-            (username,)
-        ).fetchone()
+def _bump_revision(conn, username: str):
+    """
+    Call inside the same transaction as any write that changes what the
+    dashboard or assignment list shows, so cached copies (server LRU and
+    client ETags) for this user stop matching.
+    """
+    conn.execute(SQL_BUMP_REVISION, (username,))
+
+
+def _get_revision(username: str) -> int:
+    row = get_db().execute(SQL_GET_REVISION, (username,)).fetchone()
+    return int(row["revision"]) if row else 0
+
+
+def _get_dashboard_key(username: str):
+    row = get_db().execute(SQL_GET_DASHBOARD_KEY, (username,)).fetchone()
+    if not row:
+        return 0, 85.0
+    return int(row["revision"]), float(row["current_grade"])
+
+
+def _build_dashboard(username: str, current_grade: float, today: date):
+    assignments = _load_user_assignments(username)
+
+    if not assignments:
+        return {
+            "has_assignments": False,
+            "top": [],
+            "headlines": [],
+            "stress_forecast": {
+                "high_risk_count": 0,
+                "message": "No assignments yet.",
+                "window_days": 5,
+                "high_risk_names": []
+            },
+            "gpa_impacts": [],
+            "workload_next_3_days": [],
+            "current_grade": current_grade,
+        }
+
+    # One SoA build feeds all three engine calls (None -> scalar path)
+    arrays = assignments_to_arrays(assignments)
+    summary = dashboard_summary(assignments, today, arrays=arrays)
+    gpa = gpa_impact_estimates(assignments, current_grade=current_grade, arrays=arrays)
+    workload = hours_next_days(assignments, today, window_days=3, arrays=arrays)
+
+    return {
+        "has_assignments": True,
+        "top": summary["top"],
+        "headlines": summary["headlines"],
+        "stress_forecast": summary["stress_forecast"],
+        "gpa_impacts": gpa,
+        "workload_next_3_days": workload,
+        "current_grade": current_grade,
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_dashboard(username: str, revision: int, today_iso: str, current_grade: float):
+    """
+    Returns (body, etag), body being the encoded JSON response, so a hit
+    skips serialization too. The key changes whenever the user's data
+    (revision), their grade, or the day changes.
+    """
+    payload = _build_dashboard(username, current_grade, date.fromisoformat(today_iso))
+    body = orjson.dumps(payload)
+    return body, hashlib.sha1(body).hexdigest()
+
+
+def _dashboard_body_and_etag(username: str, today: date):
+    """
+    The encoded /dashboard body and its ETag (see _cached_dashboard).
+    Reads the user's revision/grade and, on a cache miss, their open
+    assignments inside one read transaction on this thread's connection:
+    one snapshot instead of a lock/unlock per statement, and the payload
+    cached under a revision is exactly what that revision held.
+    """
+    conn = get_db()
+    conn.execute("BEGIN")
+    try:
+        revision, current_grade = _get_dashboard_key(username)
+        return _cached_dashboard(username, revision, today.isoformat(), current_grade)
+    finally:
+        conn.rollback()
+
+
+async def _get_user_grade(username: str) -> float:
+    def query():
+        return get_db().execute(SQL_GET_GRADE, (username,)).fetchone()
+
+    row = await asyncio.to_thread(query)
     return float(row["current_grade"]) if row else 85.0
 
 
-def _set_user_grade(username: str, grade: float):
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO user_settings (username, current_grade)
-            VALUES (?, ?)
-            ON CONFLICT(username) DO UPDATE SET current_grade = excluded.current_grade
-        """, (username, grade))
-        conn.commit()
+async def _set_user_grade(username: str, grade: float):
+    def write():
+        conn = get_db()
+        with conn:
+            conn.execute(SQL_UPSERT_GRADE, (username, grade))
+
+    await asyncio.to_thread(write)
 
 
-def _get_onboarded(username: str) -> bool:
-    with get_db() as conn:
-        row = conn.execute(
-            "SELECT onboarded FROM user_settings WHERE username = ?",
-            (username,)
-        ).fetchone()
+async def _get_onboarded(username: str) -> bool:
+    def query():
+        return get_db().execute(SQL_GET_ONBOARDED, (username,)).fetchone()
+
+    row = await asyncio.to_thread(query)
     return bool(row["onboarded"]) if row else False
 
 
+def _new_id():
+    """
+    Returns (id, created_at_ms). The id is a ULID-style 48-bit millisecond
+    timestamp + 80 random bits, hex-encoded so string order follows time
+    and new rows land on the right edge of the primary-key index.
+    """
+    created_at = time.time_ns() // 1_000_000
+    raw = created_at.to_bytes(6, "big") + os.urandom(10)
+    return raw.hex(), created_at
+
+
+class NewAssignment(msgspec.Struct):
+    """Body of POST /assignments, decoded and type-checked in one pass."""
+    name: str = ""
+    weightPercent: float = 0.0
+    dueDate: str = ""
+    confidence: int = 3
+    estHours: float = 0.0
+    courseId: Optional[str] = None
+
+
+_login_cache = {}
+_login_cache_lock = threading.Lock()
+
+
+def _check_password(username: str, password: str, stored_hash: str) -> bool:
+    """
+    bcrypt.checkpw, but successful checks are remembered for LOGIN_CACHE_TTL
+    so the mobile client re-logging in doesn't pay ~100 ms of bcrypt each
+    time. Only a SHA-256 of the password is kept, and the stored hash is
+    part of the key, so a changed password never matches an old entry.
+    """
+    key = (username, stored_hash, hashlib.sha256(password.encode("utf-8")).digest())
+    now = time.monotonic()
+
+    with _login_cache_lock:
+        expires = _login_cache.get(key)
+    if expires is not None and expires > now:
+        return True
+
+    if not bcrypt.checkpw(password.encode("utf-8"), stored_hash.encode("utf-8")):
+        return False
+
+    with _login_cache_lock:
+        if len(_login_cache) >= LOGIN_CACHE_MAX:
+            for k in [k for k, exp in _login_cache.items() if exp <= now]:
+                del _login_cache[k]
+            if len(_login_cache) >= LOGIN_CACHE_MAX:
+                _login_cache.clear()
+        _login_cache[key] = now + LOGIN_CACHE_TTL
+    return True
+
+
 # ----------------------------
 # Health
 # ----------------------------
 
 @app.get("/health")
-def health():
+async def health():
     return jsonify({"ok": True, "engine_ok": ENGINE_OK}), 200
 
 
@@ -184,8 +623,8 @@ def health():
 # ----------------------------
 
 @app.post("/register")
-def register():
-    body = request.get_json(silent=True) or {}
+async def register():
+    body = await request.get_json(silent=True) or {}
     username = (body.get("username") or "").strip().lower()
     password = (body.get("password") or "")
 
@@ -196,41 +635,46 @@ def register():
     if len(password) < 6:
         return jsonify({"error": "password must be at least 6 characters"}), 400
 
-    with get_db() as conn:
-        existing = conn.execute(
-            "SELECT username FROM users WHERE username = ?", (username,)
-        ).fetchone()
-        if existing:
-            return jsonify({"error": "username already taken"}), 409
-
-        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-        conn.execute(
-            "INSERT INTO users (username, password) VALUES (?, ?)",
-            (username, hashed.decode("utf-8"))
-        )
-        conn.commit()
+    def exists():
+        return get_db().execute(SQL_USER_EXISTS, (username,)).fetchone() is not None
+
+    if await asyncio.to_thread(exists):
+        return jsonify({"error": "username already taken"}), 409
+
+    hashed = await asyncio.to_thread(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt())
+
+    def insert():
+        conn = get_db()
+        with conn:
+            conn.execute(SQL_INSERT_USER, (username, hashed.decode("utf-8")))
+
+    try:
+        await asyncio.to_thread(insert)
+    except sqlite3.IntegrityError:
+        # Lost a race with a concurrent registration for the same name
+        return jsonify({"error": "username already taken"}), 409
 
     access_token = create_access_token(identity=username)
     return jsonify({"access_token": access_token}), 200
 
 
 @app.post("/login")
-def login():
-    body = request.get_json(silent=True) or {}
+async def login():
+    body = await request.get_json(silent=True) or {}
     username = (body.get("username") or "").strip().lower()
     password = (body.get("password") or "")
 
     if not username or not password:
         return jsonify({"error": "username and password required"}), 400
 
-    with get_db() as conn:
-        row = conn.execute(
-            "SELECT password FROM users WHERE username = ?", (username,)
-        ).fetchone()
+    def query():
+        return get_db().execute(SQL_GET_PASSWORD, (username,)).fetchone()
+
+    row = await asyncio.to_thread(query)
 
     if not row:
         return jsonify({"error": "invalid username or password"}), 401
-    if not bcrypt.checkpw(password.encode("utf-8"), row["password"].encode("utf-8")):
+    if not await asyncio.to_thread(_check_password, username, password, row["password"]):
         return jsonify({"error": "invalid username or password"}), 401
 
     access_token = create_access_token(identity=username)
@@ -242,45 +686,23 @@ def login():
 # ----------------------------
 
 @app.get("/dashboard")
-@jwt_required()
-def get_dashboard():
+@jwt_required
+async def get_dashboard():
     if not ENGINE_OK:
         return jsonify({"error": "engine not available", "detail": ENGINE_IMPORT_ERROR}), 500
 
     username = get_jwt_identity()
     today = date.today()
-    assignments = _load_user_assignments(username)
-    current_grade = _get_user_grade(username)
 
-    if not assignments:
-        return jsonify({
-            "has_assignments": False,
-            "top": [],
-            "headlines": [],
-            "stress_forecast": {
-                "high_risk_count": 0,
-                "message": "No assignments yet.",
-                "window_days": 5,
-                "high_risk_names": []
-            },
-            "gpa_impacts": [],
-            "workload_next_3_days": [],
-            "current_grade": current_grade,
-        }), 200
+    body, etag = await asyncio.to_thread(_dashboard_body_and_etag, username, today)
 
-    summary = dashboard_summary(assignments, today)
-    gpa = gpa_impact_estimates(assignments, current_grade=current_grade)
-    workload = hours_next_days(assignments, today, window_days=3)
+    # Per-user, and must reflect the user's own edits at once: let clients
+    # keep a copy but revalidate every time (private, no-cache + the ETag).
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag, no_cache=True)
 
-    return jsonify({
-        "has_assignments": True,
-        "top": summary["top"],
-        "headlines": summary["headlines"],
-        "stress_forecast": summary["stress_forecast"],
-        "gpa_impacts": gpa,
-        "workload_next_3_days": workload,
-        "current_grade": current_grade,
-    }), 200
+    response = app.response_class(body, mimetype="application/json")
+    return _with_validators(response, etag, no_cache=True), 200
 
 
 # ----------------------------
@@ -288,54 +710,53 @@ def get_dashboard():
 # ----------------------------
 
 @app.get("/courses")
-@jwt_required()
-def get_courses():
+@jwt_required
+async def get_courses():
     username = get_jwt_identity()
-    with get_db() as conn:
-        rows = conn.execute(
-            "SELECT * FROM courses WHERE username = ? ORDER BY created_at ASC",
-            (username,)
-        ).fetchall()
+
+    def query():
+        return get_db().execute(SQL_LIST_COURSES, (username,)).fetchall()
+
+    rows = await asyncio.to_thread(query)
     return jsonify([dict(r) for r in rows]), 200
 
 
 @app.post("/courses")
-@jwt_required()
-def create_course():
+@jwt_required
+async def create_course():
     username = get_jwt_identity()
-    body = request.get_json(silent=True) or {}
+    body = await request.get_json(silent=True) or {}
     name = str(body.get("name", "")).strip()
     color = str(body.get("color", "#4f7cff"))
 
     if not name:
         return jsonify({"error": "name required"}), 400
 
-    course_id = str(uuid4())
-    with get_db() as conn:
-        conn.execute(
-            "INSERT INTO courses (id, username, name, color, created_at) VALUES (?, ?, ?, ?, ?)",
-            (course_id, username, name, color, int(time.time() * 1000))
-        )
-        conn.commit()
+    course_id, created_at = _new_id()
+
+    def insert():
+        conn = get_db()
+        with conn:
+            conn.execute(SQL_INSERT_COURSE, (course_id, username, name, color, created_at))
 
+    await asyncio.to_thread(insert)
     return jsonify({"id": course_id, "name": name, "color": color}), 200
 
 
 @app.delete("/courses/<id>")
-@jwt_required()
-def delete_course(id):
+@jwt_required
+async def delete_course(id):
     username = get_jwt_identity()
-    with get_db() as conn:
-        # Unlink assignments from this course
-        conn.execute(
-            "UPDATE assignments SET course_id = NULL WHERE course_id = ? AND username = ?",
-            (id, username)
-        )
-        conn.execute(
-            "DELETE FROM courses WHERE id = ? AND username = ?",
-            (id, username)
-        )
-        conn.commit()
+
+    def delete():
+        conn = get_db()
+        with conn:
+            # Unlink assignments from this course
+            conn.execute(SQL_UNLINK_COURSE, (id, username))
+            conn.execute(SQL_DEL_COURSE, (id, username))
+            _bump_revision(conn, username)
+
+    await asyncio.to_thread(delete)
     return "", 204
 
 
@@ -344,57 +765,80 @@ def delete_course(id):
 # ----------------------------
 
 @app.get("/assignments")
-@jwt_required()
-def get_assignments():
+@jwt_required
+async def get_assignments():
     username = get_jwt_identity()
-    with get_db() as conn:
-        rows = conn.execute(
-            "SELECT * FROM assignments WHERE username = ? ORDER BY created_at DESC",
-            (username,)
-        ).fetchall()
-
-    result = []
-    for x in [dict(r) for r in rows]:
-        result.append({
-            "id": x["id"],
-            "name": x["name"],
-            "courseId": x.get("course_id"),
-            "weightPercent": x["weight_percent"],
-            "dueDate": x["due_date"],
-            "confidence": x["confidence"],
-            "estHours": x["est_hours"],
-            "hoursLogged": x["hours_logged"],
-            "completed": bool(x.get("completed", 0)),
-            "createdAt": x["created_at"],
-        })
-    return jsonify(result), 200
+
+    if_none_match = request.if_none_match
+
+    def query():
+        conn = get_db()
+        conn.execute("BEGIN")
+        try:
+            # Every assignment write bumps the user's revision, so
+            # (username, revision) identifies this list; check it before
+            # scanning any rows. The username keeps users at the same
+            # revision (e.g. everyone new at 0) from sharing a tag.
+            revision = _get_revision(username)
+            etag = hashlib.sha1(f"{username}:{revision}".encode()).hexdigest()
+            if if_none_match.contains_weak(etag):
+                return etag, None
+            return etag, _tuple_cursor(conn).execute(SQL_LIST_ASSIGN, (username,)).fetchall()
+        finally:
+            conn.rollback()
+
+    etag, rows = await asyncio.to_thread(query)
+    if rows is None:
+        return _not_modified(etag)
+
+    result = [{
+        "id": item_id,
+        "name": name,
+        "courseId": course_id,
+        "weightPercent": weight_percent,
+        "dueDate": due_date,
+        "confidence": confidence,
+        "estHours": est_hours,
+        "hoursLogged": hours_logged,
+        "completed": bool(completed),
+        "createdAt": created_at,
+    } for (item_id, name, course_id, weight_percent, due_date, confidence,
+           est_hours, hours_logged, completed, created_at) in rows]
+
+    return _with_validators(jsonify(result), etag), 200
 
 
 @app.post("/assignments")
-@jwt_required()
-def create_assignment():
+@jwt_required
+async def create_assignment():
     username = get_jwt_identity()
-    body = request.get_json(silent=True) or {}
 
-    name = str(body.get("name", "")).strip()
+    try:
+        # strict=False keeps accepting numbers sent as strings ("20")
+        body = msgspec.json.decode(await request.get_data(), type=NewAssignment, strict=False)
+    except (msgspec.DecodeError, msgspec.ValidationError) as e:
+        return jsonify({"error": f"invalid assignment: {e}"}), 400
+
+    name = body.name.strip()
     if not name:
         return jsonify({"error": "name required"}), 400
 
-    item_id = str(uuid4())
-    weight_percent = float(body.get("weightPercent", 0))
-    due_date = str(body.get("dueDate", ""))
-    confidence = int(body.get("confidence", 3))
-    est_hours = float(body.get("estHours", 0))
-    course_id = body.get("courseId") or None
-    created_at = int(time.time() * 1000)
-
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO assignments
-                (id, username, name, course_id, weight_percent, due_date, confidence, est_hours, hours_logged, completed, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, 0, ?)
-        """, (item_id, username, name, course_id, weight_percent, due_date, confidence, est_hours, created_at))
-        conn.commit()
+    item_id, created_at = _new_id()
+    weight_percent = body.weightPercent
+    due_date = body.dueDate
+    confidence = body.confidence
+    est_hours = body.estHours
+    course_id = body.courseId or None
+
+    def insert():
+        conn = get_db()
+        with conn:
+            conn.execute(SQL_INSERT_ASSIGN, (
+                item_id, username, name, course_id, weight_percent, due_date, confidence, est_hours, created_at
+            ))
+            _bump_revision(conn, username)
+
+    await asyncio.to_thread(insert)
 
     return jsonify({
         "id": item_id,
@@ -411,10 +855,10 @@ def create_assignment():
 
 
 @app.patch("/assignments/<id>")
-@jwt_required()
-def update_assignment(id):
+@jwt_required
+async def update_assignment(id):
     username = get_jwt_identity()
-    body = request.get_json(silent=True) or {}
+    body = await request.get_json(silent=True) or {}
 
     fields = []
     values = []
@@ -442,68 +886,75 @@ def update_assignment(id):
         return jsonify({"error": "nothing to update"}), 400
 
     values.extend([id, username])
-    with get_db() as conn:
-        conn.execute(
-            f"UPDATE assignments SET {', '.join(fields)} WHERE id = ? AND username = ?",
-            values
-        )
-        conn.commit()
 
+    def update():
+        conn = get_db()
+        with conn:
+            conn.execute(
+                f"UPDATE assignments SET {', '.join(fields)} WHERE id = ? AND username = ?",
+                values
+            )
+            _bump_revision(conn, username)
+
+    await asyncio.to_thread(update)
     return jsonify({"ok": True}), 200
 
 
 @app.post("/assignments/<id>/complete")
-@jwt_required()
-def complete_assignment(id):
+@jwt_required
+async def complete_assignment(id):
     username = get_jwt_identity()
-    with get_db() as conn:
-        conn.execute(
-            "UPDATE assignments SET completed = 1 WHERE id = ? AND username = ?",
-            (id, username)
-        )
-        conn.commit()
+
+    def update():
+        conn = get_db()
+        with conn:
+            conn.execute(SQL_COMPLETE_ASSIGN, (id, username))
+            _bump_revision(conn, username)
+
+    await asyncio.to_thread(update)
     return jsonify({"ok": True}), 200
 
 
 @app.post("/assignments/<id>/log-hours")
-@jwt_required()
-def log_hours(id):
+@jwt_required
+async def log_hours(id):
     username = get_jwt_identity()
-    body = request.get_json(silent=True) or {}
+    body = await request.get_json(silent=True) or {}
     hours = float(body.get("hours", 0))
 
     if hours <= 0:
         return jsonify({"error": "hours must be > 0"}), 400
 
-    with get_db() as conn:
-        row = conn.execute(
-            "SELECT est_hours, hours_logged FROM assignments WHERE id = ? AND username = ?",
-            (id, username)
-        ).fetchone()
+    def update():
+        conn = get_db()
+        with conn:
+            row = conn.execute(SQL_LOG_HOURS, (hours, id, username)).fetchone()
 
-        if not row:
-            return jsonify({"error": "assignment not found"}), 404
+            if not row:
+                return None
 
-        new_logged = float(row["hours_logged"]) + hours
-        conn.execute(
-            "UPDATE assignments SET hours_logged = ? WHERE id = ? AND username = ?",
-            (new_logged, id, username)
-        )
-        conn.commit()
+            _bump_revision(conn, username)
+            return float(row["hours_logged"])
+
+    new_logged = await asyncio.to_thread(update)
+    if new_logged is None:
+        return jsonify({"error": "assignment not found"}), 404
 
     return jsonify({"hours_logged": new_logged}), 200
 
 
 @app.delete("/assignments/<id>")
-@jwt_required()
-def delete_assignment(id):
+@jwt_required
+async def delete_assignment(id):
     username = get_jwt_identity()
-    with get_db() as conn:
-        conn.execute(
-            "DELETE FROM assignments WHERE id = ? AND username = ?",
-            (id, username)
-        )
-        conn.commit()
+
+    def delete():
+        conn = get_db()
+        with conn:
+            conn.execute(SQL_DEL_ASSIGN, (id, username))
+            _bump_revision(conn, username)
+
+    await asyncio.to_thread(delete)
     return "", 204
 
 
@@ -512,51 +963,50 @@ def delete_assignment(id):
 # ----------------------------
 
 @app.get("/settings")
-@jwt_required()
-def get_settings():
+@jwt_required
+async def get_settings():
     username = get_jwt_identity()
-    grade = _get_user_grade(username)
-    onboarded = _get_onboarded(username)
+    grade, onboarded = await asyncio.gather(
+        _get_user_grade(username),
+        _get_onboarded(username),
+    )
     return jsonify({"current_grade": grade, "onboarded": onboarded}), 200
 
 
 @app.post("/settings")
-@jwt_required()
-def update_settings():
+@jwt_required
+async def update_settings():
     username = get_jwt_identity()
-    body = request.get_json(silent=True) or {}
-
-    with get_db() as conn:
-        # Ensure row exists
-        conn.execute("""
-            INSERT INTO user_settings (username, current_grade, onboarded)
-            VALUES (?, 85.0, 0)
-            ON CONFLICT(username) DO NOTHING
-        """, (username,))
-
-        if "current_grade" in body:
-            grade = float(body["current_grade"])
-            if not (0 <= grade <= 100):
-                return jsonify({"error": "current_grade must be 0–100"}), 400
-            conn.execute(
-                "UPDATE user_settings SET current_grade = ? WHERE username = ?",
-                (grade, username)
-            )
+    body = await request.get_json(silent=True) or {}
 
-        if "onboarded" in body:
-            conn.execute(
-                "UPDATE user_settings SET onboarded = ? WHERE username = ?",
-                (1 if body["onboarded"] else 0, username)
-            )
+    grade = None
+    if "current_grade" in body:
+        grade = float(body["current_grade"])
+        if not (0 <= grade <= 100):
+            return jsonify({"error": "current_grade must be 0–100"}), 400
 
-        conn.commit()
+    def update():
+        conn = get_db()
+        with conn:
+            # Ensure row exists
+            conn.execute(SQL_ENSURE_SETTINGS, (username,))
 
-    return jsonify({
-        "current_grade": _get_user_grade(username),
-        "onboarded": _get_onboarded(username),
-    }), 200
+            if grade is not None:
+                conn.execute(SQL_SET_GRADE, (grade, username))
+
+            if "onboarded" in body:
+                conn.execute(SQL_SET_ONBOARDED, (1 if body["onboarded"] else 0, username))
+
+    await asyncio.to_thread(update)
+
+    grade, onboarded = await asyncio.gather(
+        _get_user_grade(username),
+        _get_onboarded(username),
+    )
+    return jsonify({"current_grade": grade, "onboarded": onboarded}), 200
 
 
 if __name__ == "__main__":
+    # Local development only; production runs under hypercorn (see Procfile).
     port = int(os.environ.get("PORT", "5000"))
-    app.run(host="0.0.0.0", port=port, debug=True)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=port, debug=os.environ.get("QUART_DEBUG") == "1")
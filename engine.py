@@ -9,26 +9,53 @@ Later:
 • That way, the logic can be reused anywhere
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple, Union
+import bisect
+import functools
+import heapq
 import json
+import math
+import os
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:  # the scalar functions below work without it
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # the NumPy kernels below are used instead
+    njit = None
+
+try:
+    import msgspec
+except ImportError:  # file IO falls back to the stdlib json module
+    msgspec = None
 
 
 # ----------------------------
 # DATA MODELS
 # ----------------------------
 
-@dataclass
+# Immutable so instances can be shared (load_assignments cache) and hashed.
+@dataclass(slots=True, frozen=True)
 class Assignment:
     name: str
     weight_percent: float      # 0–100
     due_date: date             # python date object
     confidence: int            # 1–5
     estimated_hours: float     # 0+
+    due_ordinal: int = field(init=False, repr=False, compare=False)  # due_date.toordinal()
 
+    def __post_init__(self):
+        object.__setattr__(self, "due_ordinal", self.due_date.toordinal())
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DailyLog:
     sleep_hours: float
     class_hours: float
@@ -43,7 +70,17 @@ class DailyLog:
 # ----------------------------
 
 def parse_date(iso_yyyy_mm_dd: str) -> date:
-    return datetime.strptime(iso_yyyy_mm_dd, "%Y-%m-%d").date()
+    s = iso_yyyy_mm_dd
+    # Canonical YYYY-MM-DD (everything we write) skips strptime's format
+    # parser; anything else (e.g. unpadded "2026-1-5") takes the slow path.
+    # int() alone would also take "+026" or non-ASCII digits, which
+    # strptime rejects, hence the ASCII digit checks.
+    if (
+        len(s) == 10 and s[4] == "-" and s[7] == "-" and s.isascii()
+        and s[0:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit()
+    ):
+        return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+    return datetime.strptime(s, "%Y-%m-%d").date()
 
 
 def days_until(due: date, today: date) -> int:
@@ -57,21 +94,23 @@ def clamp(value: float, lo: float, hi: float) -> float:
 # ----------------------------
 # 1) SYLLABUS DECODER (RISK)
 # ----------------------------
+# calc_risk, calc_urgency, danger_score and start_by_date are memoized on
+# (assignment, today, ...): Assignment is frozen, so equal inputs always
+# give equal results. The cached dicts (_calc_risk, _calc_urgency,
+# _start_by_date) are shared process-wide and only read inside this module;
+# the public functions hand out copies, so callers may mutate what they get.
 
-def calc_risk(a: Assignment, today: date) -> Dict[str, object]:
-    dleft = days_until(a.due_date, today)
-
-    # urgency bucket
-    if dleft <= 1:
-        soon = 10
-    elif dleft <= 3:
-        soon = 8
-    elif dleft <= 7:
-        soon = 6
-    elif dleft <= 14:
-        soon = 4
-    else:
-        soon = 2
+# urgency bucket: days left <= 1 -> 10, <= 3 -> 8, <= 7 -> 6, <= 14 -> 4, else 2
+SOON_THRESHOLDS = (1, 3, 7, 14)
+SOON_POINTS = (10, 8, 6, 4, 2)
+
+
+@functools.lru_cache(maxsize=4096)
+def _calc_risk(a: Assignment, today: date) -> Dict[str, object]:
+    dleft = a.due_ordinal - today.toordinal()
+
+    # bisect_left counts thresholds < dleft, i.e. the first one with dleft <= it
+    soon = SOON_POINTS[bisect.bisect_left(SOON_THRESHOLDS, dleft)]
 
     doubt = 6 - clamp(a.confidence, 1, 5)
     weight_scaled = clamp(a.weight_percent, 0, 100) / 10.0
@@ -93,9 +132,13 @@ def calc_risk(a: Assignment, today: date) -> Dict[str, object]:
     }
 
 
+def calc_risk(a: Assignment, today: date) -> Dict[str, object]:
+    return dict(_calc_risk(a, today))
+
+
 def rank_assignments(assignments: List[Assignment], today: date) -> List[Dict[str, object]]:
     scored = [calc_risk(a, today) for a in assignments]
-    scored.sort(key=lambda x: x["risk_score"], reverse=True)
+    scored.sort(key=itemgetter("risk_score"), reverse=True)
     return scored
 
 
@@ -103,18 +146,18 @@ def rank_assignments(assignments: List[Assignment], today: date) -> List[Dict[st
 # 2) DEADLINE RUSH (URGENCY)
 # ----------------------------
 
+# hours/day <= 1 -> Safe, <= 2.5 -> Steady, <= 4 -> Crunch Zone, else Panic Zone
+ZONE_THRESHOLDS = (1.0, 2.5, 4.0)
+ZONE_LABELS = ("Safe", "Steady", "Crunch Zone", "Panic Zone")
+
+
 def urgency_zone(hours_per_day: float) -> str:
-    if hours_per_day <= 1:
-        return "Safe"
-    if hours_per_day <= 2.5:
-        return "Steady"
-    if hours_per_day <= 4:
-        return "Crunch Zone"
-    return "Panic Zone"
+    return ZONE_LABELS[bisect.bisect_left(ZONE_THRESHOLDS, hours_per_day)]
 
 
-def calc_urgency(a: Assignment, today: date, start_delay_days: int = 0) -> Dict[str, object]:
-    dleft_after_delay = days_until(a.due_date, today) - start_delay_days
+@functools.lru_cache(maxsize=4096)
+def _calc_urgency(a: Assignment, today: date, start_delay_days: int = 0) -> Dict[str, object]:
+    dleft_after_delay = a.due_ordinal - today.toordinal() - start_delay_days
 
     # overdue is special
     if dleft_after_delay < 0:
@@ -138,6 +181,10 @@ def calc_urgency(a: Assignment, today: date, start_delay_days: int = 0) -> Dict[
     }
 
 
+def calc_urgency(a: Assignment, today: date, start_delay_days: int = 0) -> Dict[str, object]:
+    return dict(_calc_urgency(a, today, start_delay_days))
+
+
 def urgency_curve(a: Assignment, today: date, max_delay_days: int = 3) -> List[Dict[str, object]]:
     return [calc_urgency(a, today, delay) for delay in range(0, max_delay_days + 1)]
 
@@ -146,51 +193,87 @@ def urgency_curve(a: Assignment, today: date, max_delay_days: int = 3) -> List[D
 # 3) COMBINED "DANGER" SCORE
 # ----------------------------
 
-def danger_score(a: Assignment, today: date) -> float:
-    r = calc_risk(a, today)
-    risk = float(r["risk_score"])
-
-    u = calc_urgency(a, today, start_delay_days=0)
-    hours_per_day = u["hours_per_day"]
-
+def danger_score_from(risk: float, hours_per_day: Optional[float]) -> float:
+    """
+    Danger from an already-computed risk_score and hours_per_day (None when
+    overdue), for callers that have calc_risk/calc_urgency results in hand.
+    """
     if hours_per_day is None:
         urgency_scaled = 10.0
     else:
         urgency_scaled = min(5.0, float(hours_per_day)) * 2.0  # cap 5 -> 10
 
-    raw = (0.7 * risk) + (0.3 * urgency_scaled)
+    raw = (0.7 * float(risk)) + (0.3 * urgency_scaled)
     return round(raw, 2)
 
 
-def rank_assignments_by_danger(assignments: List[Assignment], today: date) -> List[Dict[str, object]]:
-    results: List[Dict[str, object]] = []
-    for a in assignments:
-        r = calc_risk(a, today)
-        u = calc_urgency(a, today, 0)
-        results.append({
-            "name": a.name,
-            "risk_score": r["risk_score"],
-            "risk_label": r["risk_label"],
-            "hours_per_day": u["hours_per_day"],
-            "zone": u["zone"],
-            "danger_score": danger_score(a, today)
-        })
+@functools.lru_cache(maxsize=4096)
+def danger_score(a: Assignment, today: date) -> float:
+    r = _calc_risk(a, today)
+    u = _calc_urgency(a, today, start_delay_days=0)
+    return danger_score_from(r["risk_score"], u["hours_per_day"])
+
+
+def rank_assignments_by_danger(
+    assignments: List[Assignment],
+    today: date,
+    arrays: Optional["AssignmentArrays"] = None,
+    top_k: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """
+    Highest danger first. With top_k, only the first top_k entries are
+    returned (same order as the full ranking, ties included).
+    """
+    if not assignments:
+        return []
+    if arrays is not None:
+        return rank_assignments_by_danger_vec(arrays, today, top_k=top_k)
+
+    results = [_danger_row(a, _calc_risk(a, today), _calc_urgency(a, today, 0)) for a in assignments]
+
+    if top_k is not None:
+        # O(N log k); nlargest is stable like the full sort below
+        return heapq.nlargest(top_k, results, key=itemgetter("danger_score"))
 
-    results.sort(key=lambda x: x["danger_score"], reverse=True)
+    results.sort(key=itemgetter("danger_score"), reverse=True)
     return results
 
 
+def _danger_row(a: Assignment, r: Dict[str, object], u: Dict[str, object]) -> Dict[str, object]:
+    # one ranked entry from a's calc_risk (r) and calc_urgency (u) results
+    return {
+        "name": a.name,
+        "risk_score": r["risk_score"],
+        "risk_label": r["risk_label"],
+        "hours_per_day": u["hours_per_day"],
+        "zone": u["zone"],
+        "danger_score": danger_score_from(r["risk_score"], u["hours_per_day"])
+    }
+
+
 # ----------------------------
 # 4) STRESS FORECAST
 # ----------------------------
 
-def stress_forecast(assignments: List[Assignment], today: date, window_days: int = 5) -> Dict[str, object]:
-    high_risk = []
-    for a in assignments:
-        r = calc_risk(a, today)
-        if 0 <= r["days_left"] <= window_days and r["risk_label"] == "High":
-            high_risk.append(a.name)
+def stress_forecast(
+    assignments: List[Assignment],
+    today: date,
+    window_days: int = 5,
+    arrays: Optional["AssignmentArrays"] = None,
+) -> Dict[str, object]:
+    if arrays is not None:
+        high_risk = stress_high_risk_names_vec(arrays, today, window_days)
+    else:
+        high_risk = []
+        for a in assignments:
+            r = _calc_risk(a, today)
+            if 0 <= r["days_left"] <= window_days and r["risk_label"] == "High":
+                high_risk.append(a.name)
+
+    return _stress_by_risk(high_risk, window_days)
+
 
+def _stress_by_risk(high_risk: List[str], window_days: int) -> Dict[str, object]:
     count = len(high_risk)
     word = "assignment" if count == 1 else "assignments"
 
@@ -205,13 +288,17 @@ def stress_forecast(assignments: List[Assignment], today: date, window_days: int
 def stress_forecast_by_danger(assignments: List[Assignment], today: date, window_days: int = 5) -> Dict[str, object]:
     danger_list = []
     for a in assignments:
-        r = calc_risk(a, today)
+        r = _calc_risk(a, today)
         dleft = r["days_left"]
         if 0 <= dleft <= window_days:
-            u = calc_urgency(a, today, 0)
+            u = _calc_urgency(a, today, 0)
             if u["zone"] in ("Crunch Zone", "Panic Zone"):
                 danger_list.append(a.name)
 
+    return _stress_by_zone(danger_list, window_days)
+
+
+def _stress_by_zone(danger_list: List[str], window_days: int) -> Dict[str, object]:
     return {
         "window_days": window_days,
         "crunch_or_panic_count": len(danger_list),
@@ -220,12 +307,63 @@ def stress_forecast_by_danger(assignments: List[Assignment], today: date, window
     }
 
 
+def stress_forecast_combined(assignments: List[Assignment], today: date, window_days: int = 5) -> Dict[str, object]:
+    """
+    stress_forecast and stress_forecast_by_danger from one pass (one
+    calc_risk per assignment): {"by_risk": ..., "by_zone": ...}.
+    """
+    high_risk = []
+    danger_list = []
+    for a in assignments:
+        r = _calc_risk(a, today)
+        if not 0 <= r["days_left"] <= window_days:
+            continue
+        if r["risk_label"] == "High":
+            high_risk.append(a.name)
+        if _calc_urgency(a, today, 0)["zone"] in ("Crunch Zone", "Panic Zone"):
+            danger_list.append(a.name)
+
+    return {
+        "by_risk": _stress_by_risk(high_risk, window_days),
+        "by_zone": _stress_by_zone(danger_list, window_days),
+    }
+
+
 # ----------------------------
 # 5) START-BY DATE
 # ----------------------------
 
-def start_by_date(a: Assignment, today: date, crunch_threshold: float = 2.5) -> Dict[str, object]:
-    total_days_left = days_until(a.due_date, today)
+def _first_crunch_delay(hours: float, total_days_left: int, threshold: float) -> Optional[int]:
+    """
+    Smallest delay in [0, total_days_left] at which
+    hours / max(1, total_days_left - delay) exceeds threshold, or None.
+    """
+    if threshold <= 0:
+        # no monotonic shortcut here (negative hours shrink as days do)
+        for delay in range(total_days_left + 1):
+            if hours / max(1, total_days_left - delay) > threshold:
+                return delay
+        return None
+
+    # hours/day only grows as the start slips, peaking at hours / 1
+    if not hours > threshold:
+        return None
+
+    # Widest spread (in days) that still crunches is just under
+    # hours / threshold; estimate it, then settle it with the same float
+    # comparison the day-by-day scan made so the boundaries agree exactly.
+    limit = hours / threshold
+    spread = total_days_left if limit > total_days_left else max(1, int(limit))
+    while spread < total_days_left and hours / (spread + 1) > threshold:
+        spread += 1
+    while spread > 1 and not hours / spread > threshold:
+        spread -= 1
+    return total_days_left - spread
+
+
+@functools.lru_cache(maxsize=4096)
+def _start_by_date(a: Assignment, today: date, crunch_threshold: float = 2.5) -> Dict[str, object]:
+    total_days_left = a.due_ordinal - today.toordinal()
 
     if total_days_left <= 0:
         return {
@@ -235,22 +373,19 @@ def start_by_date(a: Assignment, today: date, crunch_threshold: float = 2.5) ->
             "message": "Start immediately — already at deadline."
         }
 
-    for delay in range(total_days_left + 1):
-        dleft_after_delay = total_days_left - delay
-        effective_days = max(1, dleft_after_delay)
-        hours_per_day = a.estimated_hours / effective_days
-
-        if hours_per_day > crunch_threshold:
-            safe_delay = max(0, delay - 1)
-            start_date = today + timedelta(days=safe_delay)
-            zone_if_wait = urgency_zone(hours_per_day)
+    delay = _first_crunch_delay(a.estimated_hours, total_days_left, crunch_threshold)
+    if delay is not None:
+        hours_per_day = a.estimated_hours / max(1, total_days_left - delay)
+        safe_delay = max(0, delay - 1)
+        start_date = today + timedelta(days=safe_delay)
+        zone_if_wait = urgency_zone(hours_per_day)
 
-            return {
-                "name": a.name,
-                "start_by_days": safe_delay,
-                "start_by_date": start_date.isoformat(),
-                "message": f"Start by {start_date.isoformat()} to avoid {zone_if_wait}."
-            }
+        return {
+            "name": a.name,
+            "start_by_days": safe_delay,
+            "start_by_date": start_date.isoformat(),
+            "message": f"Start by {start_date.isoformat()} to avoid {zone_if_wait}."
+        }
 
     return {
         "name": a.name,
@@ -260,20 +395,40 @@ def start_by_date(a: Assignment, today: date, crunch_threshold: float = 2.5) ->
     }
 
 
+def start_by_date(a: Assignment, today: date, crunch_threshold: float = 2.5) -> Dict[str, object]:
+    return dict(_start_by_date(a, today, crunch_threshold))
+
+
 # ----------------------------
 # 6) WORKLOAD PROJECTION
 # ----------------------------
 
-def workload_projection(assignments: List[Assignment], today: date, days: int = 7) -> List[Dict[str, object]]:
+def workload_projection(
+    assignments: List[Assignment],
+    today: date,
+    days: int = 7,
+    arrays: Optional["AssignmentArrays"] = None,
+    with_breakdown: bool = True,
+) -> List[Dict[str, object]]:
+    """
+    One entry per day: date, total_hours and (unless with_breakdown=False)
+    the per-assignment breakdown. Callers that only read totals should
+    pass with_breakdown=False and skip building days × N dicts.
+    """
+    if arrays is not None:
+        return workload_projection_vec(arrays, today, days=days, with_breakdown=with_breakdown)
+
     projection: List[Dict[str, object]] = []
+    today_ord = today.toordinal()
 
     for i in range(days):
         day = today + timedelta(days=i)
+        day_ord = today_ord + i
         total = 0.0
         breakdown: List[Dict[str, object]] = []
 
         for a in assignments:
-            dleft = days_until(a.due_date, day)
+            dleft = a.due_ordinal - day_ord
             if dleft < 0:
                 continue
 
@@ -281,31 +436,39 @@ def workload_projection(assignments: List[Assignment], today: date, days: int =
             daily_hours = a.estimated_hours / effective_days
 
             total += daily_hours
-            breakdown.append({
-                "name": a.name,
-                "daily_hours": round(daily_hours, 2),
-                "due_date": a.due_date.isoformat()
-            })
-
-        projection.append({
+            if with_breakdown:
+                breakdown.append({
+                    "name": a.name,
+                    "daily_hours": round(daily_hours, 2),
+                    "due_date": a.due_date.isoformat()
+                })
+
+        entry = {
             "date": day.isoformat(),
             "total_hours": round(total, 2),
-            "breakdown": breakdown
-        })
+        }
+        if with_breakdown:
+            entry["breakdown"] = breakdown
+        projection.append(entry)
 
     return projection
 
 
-def hours_next_days(assignments: List[Assignment], today: date, window_days: int = 3) -> List[Dict[str, object]]:
+def hours_next_days(
+    assignments: List[Assignment],
+    today: date,
+    window_days: int = 3,
+    arrays: Optional["AssignmentArrays"] = None,
+) -> List[Dict[str, object]]:
     """
     IMPORTANT: This returns a LIST (so your app.py can do sum(x.get("hours")...)).
     """
-    proj = workload_projection(assignments, today, days=window_days)
+    proj = workload_projection(assignments, today, days=window_days, arrays=arrays, with_breakdown=False)
     return [{"date": d["date"], "hours": float(d["total_hours"])} for d in proj]
 
 
 def workload_text_bars(assignments: List[Assignment], today: date, window_days: int = 7, blocks_per_hour: int = 2) -> List[str]:
-    proj = workload_projection(assignments, today, days=window_days)
+    proj = workload_projection(assignments, today, days=window_days, with_breakdown=False)
     lines: List[str] = []
     for day in proj:
         h = float(day["total_hours"])
@@ -372,14 +535,21 @@ def gpa_impact_estimate(a: Assignment, current_grade: float, predicted_score: fl
     }
 
 
-def gpa_impact_estimates(assignments: List[Assignment], current_grade: float) -> List[Dict[str, object]]:
+def gpa_impact_estimates(
+    assignments: List[Assignment],
+    current_grade: float,
+    arrays: Optional["AssignmentArrays"] = None,
+) -> List[Dict[str, object]]:
     """
     ✅ This is the function your app.py is trying to import.
     Returns a list of per-assignment GPA/grade impact estimates.
     """
+    if arrays is not None:
+        return gpa_impact_estimates_vec(arrays, current_grade)
+
     impacts = [gpa_impact_estimate(a, current_grade) for a in assignments]
     # sort: most negative delta first (biggest possible drop)
-    impacts.sort(key=lambda x: x["delta_points"])
+    impacts.sort(key=itemgetter("delta_points"))
     return impacts
 
 
@@ -387,11 +557,42 @@ def gpa_impact_estimates(assignments: List[Assignment], current_grade: float) ->
 # 8) DASHBOARD SUMMARY (FIXED)
 # ----------------------------
 
-def dashboard_summary(assignments: List[Assignment], today: date) -> Dict[str, object]:
-    ranked = rank_assignments_by_danger(assignments, today)
-    forecast = stress_forecast(assignments, today, window_days=5)
+def dashboard_summary(
+    assignments: List[Assignment],
+    today: date,
+    arrays: Optional["AssignmentArrays"] = None,
+) -> Dict[str, object]:
+    window_days = 5
 
-    by_name = {a.name: a for a in assignments}
+    if not assignments:
+        return {
+            "stress_forecast": _stress_by_risk([], window_days),
+            "top": [],
+            "headlines": []
+        }
+
+    if arrays is not None:
+        ranked = rank_assignments_by_danger(assignments, today, arrays=arrays, top_k=3)
+        forecast = stress_forecast(assignments, today, window_days=window_days, arrays=arrays)
+        by_name = {a.name: a for a in assignments}
+    else:
+        # One pass feeds the ranking, the stress forecast and the name lookup
+        # (same results as rank_assignments_by_danger + stress_forecast).
+        # Candidates are plain (danger, a, r, u) tuples; only the top 3
+        # become row dicts.
+        scored: List[tuple] = []
+        high_risk: List[str] = []
+        by_name = {}
+        for a in assignments:
+            r = _calc_risk(a, today)
+            u = _calc_urgency(a, today, 0)
+            scored.append((danger_score_from(r["risk_score"], u["hours_per_day"]), a, r, u))
+            if 0 <= r["days_left"] <= window_days and r["risk_label"] == "High":
+                high_risk.append(a.name)
+            by_name[a.name] = a
+
+        ranked = [_danger_row(a, r, u) for _, a, r, u in heapq.nlargest(3, scored, key=itemgetter(0))]
+        forecast = _stress_by_risk(high_risk, window_days)
 
     zone_emoji = {
         "Safe": "🌿",
@@ -409,7 +610,7 @@ def dashboard_summary(assignments: List[Assignment], today: date) -> Dict[str, o
     headlines: List[str] = []
     top: List[Dict[str, object]] = []
 
-    for item in ranked[:3]:
+    for item in ranked:
         name = item["name"]
         a = by_name.get(name)
         if not a:
@@ -448,6 +649,11 @@ def dashboard_summary(assignments: List[Assignment], today: date) -> Dict[str, o
 # 9) FILE IO (LOAD/SAVE)
 # ----------------------------
 
+# The umask can only be read by setting it, process-wide; do that once, at
+# import, rather than racing other threads on every save.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
 def assignment_to_dict(a: Assignment) -> Dict[str, object]:
     return {
         "name": a.name,
@@ -468,16 +674,367 @@ def assignment_from_dict(d: Dict[str, object]) -> Assignment:
     )
 
 
+if msgspec is not None:
+    class AssignmentWire(msgspec.Struct):
+        """
+        On-disk shape of an Assignment (same keys as assignment_to_dict).
+        Numbers may also arrive as strings ("10"); those are kept as str and
+        converted with int()/float() like assignment_from_dict does, since
+        msgspec's own lax parsing accepts a different set ("1e1" as an int,
+        not " 3").
+        """
+        name: str
+        weight_percent: Union[float, str]
+        due_date: str
+        confidence: Union[int, str]
+        estimated_hours: Union[float, str]
+
+    # Fast path for files we wrote. Anything the typed decoder rejects goes
+    # through the stdlib path in _load_assignments_cached, so a file gives
+    # the same Assignments, or the same exception, with or without msgspec.
+    _wire_decoder = msgspec.json.Decoder(List[AssignmentWire])
+    _wire_encoder = msgspec.json.Encoder()
+
+
 def save_assignments(path: str, assignments: List[Assignment]) -> None:
-    data = [assignment_to_dict(a) for a in assignments]
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    # msgspec writes NaN/inf as null, which no loader reads back as a float;
+    # stdlib json writes NaN/Infinity, which json.loads accepts.
+    if msgspec is not None and not any(
+        isinstance(v, float) and not math.isfinite(v)
+        for a in assignments
+        for v in (a.weight_percent, a.confidence, a.estimated_hours)
+    ):
+        payload = _wire_encoder.encode([
+            AssignmentWire(
+                name=a.name,
+                weight_percent=a.weight_percent,
+                due_date=a.due_date.isoformat(),
+                confidence=a.confidence,
+                estimated_hours=a.estimated_hours,
+            )
+            for a in assignments
+        ])
+    else:
+        data = [assignment_to_dict(a) for a in assignments]
+        payload = json.dumps(data, separators=(",", ":")).encode()
+
+    # Write a uniquely named sibling temp file and swap it in, so a crash
+    # mid-write leaves the old file intact instead of a truncated one, and
+    # two concurrent saves never share a temp file. The fsync makes the data
+    # durable before the rename publishes it; without it a power loss could
+    # leave the new name pointing at an empty file.
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".assignments-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600; keep the mode of the file being replaced, or
+        # give a new one what open(path, "w") would have
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=4)
+def _load_assignments_cached(path: str, ino: int, mtime_ns: int, size: int) -> Tuple[Assignment, ...]:
+    # ino/mtime_ns/size are only the cache key: a save swaps in a new file
+    # (and any other write bumps mtime), so a stale entry is never hit again.
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    if msgspec is not None:
+        try:
+            wires = _wire_decoder.decode(raw)
+        except msgspec.DecodeError:
+            # Malformed JSON, NaN/Infinity, or a record that isn't exactly
+            # the wire types (e.g. "confidence": 3.0, a numeric name). Redo
+            # it the lenient way: same result and same errors
+            # (json.JSONDecodeError, ...) as without msgspec.
+            pass
+        else:
+            return tuple(
+                Assignment(
+                    name=w.name,
+                    weight_percent=float(w.weight_percent),
+                    due_date=parse_date(w.due_date),
+                    confidence=int(w.confidence),
+                    estimated_hours=float(w.estimated_hours),
+                )
+                for w in wires
+            )
+
+    return tuple(assignment_from_dict(item) for item in json.loads(raw))
 
 
 def load_assignments(path: str) -> List[Assignment]:
+    """
+    Re-reads and re-parses the file only when it changed on disk. The
+    (frozen) Assignment objects are shared between calls.
+    """
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
-        return [assignment_from_dict(item) for item in data]
+        st = os.stat(path)
+        return list(_load_assignments_cached(path, st.st_ino, st.st_mtime_ns, st.st_size))
     except FileNotFoundError:
-        return []
\ No newline at end of file
+        return []
+
+
+# ----------------------------
+# 10) BATCH (NumPy) PATH
+# ----------------------------
+# Same math as sections 1–4, 6 and 7, computed column-wise over a
+# Structure-of-Arrays instead of one Assignment at a time. Every function
+# here returns exactly what its scalar counterpart returns.
+
+# Below this many assignments the array setup costs more than it saves.
+# Measured on the full dashboard (summary + GPA + 3-day workload), NumPy
+# without numba: the memoized scalar path ties around 40-50 rows when its
+# caches are warm (the common dashboard rebuild after one edit) and is
+# already ~2x slower by 100. Re-measure when either path changes.
+VECTORIZE_MIN_ROWS = 48
+
+
+@dataclass
+class AssignmentArrays:
+    assignments: List[Assignment]
+    weight_percent: "np.ndarray"   # float64
+    due_ordinal: "np.ndarray"      # int64, Assignment.due_ordinal
+    confidence: "np.ndarray"       # float64
+    estimated_hours: "np.ndarray"  # float64
+
+
+def assignments_to_arrays(assignments: List[Assignment], min_rows: int = VECTORIZE_MIN_ROWS) -> Optional[AssignmentArrays]:
+    """
+    Build the SoA view once per request. Returns None when numpy isn't
+    installed or the list is shorter than min_rows — pass the result
+    straight through as `arrays=` and the scalar path is used instead.
+    """
+    n = len(assignments)
+    if np is None or n < min_rows:
+        return None
+    return AssignmentArrays(
+        assignments=assignments,
+        weight_percent=np.fromiter((a.weight_percent for a in assignments), dtype=np.float64, count=n),
+        due_ordinal=np.fromiter((a.due_ordinal for a in assignments), dtype=np.int64, count=n),
+        confidence=np.fromiter((a.confidence for a in assignments), dtype=np.float64, count=n),
+        estimated_hours=np.fromiter((a.estimated_hours for a in assignments), dtype=np.float64, count=n),
+    )
+
+
+def _round2(values: "np.ndarray") -> "np.ndarray":
+    # np.round(x, 2) scales by 100 first, so it disagrees with round(x, 2)
+    # on near-ties (e.g. 10 / 8 hours). Redo just those with Python's round.
+    scaled = values * 100.0
+    out = np.rint(scaled) / 100.0
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        idx = np.flatnonzero(near_half)
+        out.flat[idx] = [round(v, 2) for v in values.ravel()[idx].tolist()]
+    return out
+
+
+def _risk_kernel_np(dleft, weight, conf):
+    soon = np.asarray(SOON_POINTS)[np.searchsorted(SOON_THRESHOLDS, dleft, side="left")]
+    doubt = 6 - np.clip(conf, 1, 5)
+    weight_scaled = np.clip(weight, 0, 100) / 10.0
+
+    risk = (0.4 * soon) + (0.4 * weight_scaled) + (0.2 * doubt)
+    label_idx = np.select([risk < 3.5, risk < 5.5], [0, 1], 2)
+    return risk, label_idx
+
+
+def _risk_kernel_loop(dleft, weight, conf):
+    # calc_risk's buckets as a plain loop, for numba to compile. Same
+    # operation order as _risk_kernel_np so results match to the bit (hence
+    # no fastmath).
+    n = dleft.shape[0]
+    risk = np.empty(n, dtype=np.float64)
+    label_idx = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        d = dleft[i]
+        if d <= 1:
+            soon = 10
+        elif d <= 3:
+            soon = 8
+        elif d <= 7:
+            soon = 6
+        elif d <= 14:
+            soon = 4
+        else:
+            soon = 2
+
+        doubt = 6 - min(max(conf[i], 1.0), 5.0)
+        weight_scaled = min(max(weight[i], 0.0), 100.0) / 10.0
+
+        r = (0.4 * soon) + (0.4 * weight_scaled) + (0.2 * doubt)
+        risk[i] = r
+        if r < 3.5:
+            label_idx[i] = 0
+        elif r < 5.5:
+            label_idx[i] = 1
+        else:
+            label_idx[i] = 2
+    return risk, label_idx
+
+
+# Compiled once per install (cache=True writes to __pycache__ or
+# NUMBA_CACHE_DIR); without numba the NumPy version does the same work.
+_risk_kernel = njit(cache=True)(_risk_kernel_loop) if njit is not None else _risk_kernel_np
+
+RISK_LABELS = ("Low", "Medium", "High")
+
+
+def calc_risk_vec(arrs: AssignmentArrays, today: date) -> Dict[str, "np.ndarray"]:
+    dleft = arrs.due_ordinal - today.toordinal()
+    risk, label_idx = _risk_kernel(dleft, arrs.weight_percent, arrs.confidence)
+    return {
+        "days_left": dleft,
+        "risk_score": _round2(risk),
+        "risk_label": np.array(RISK_LABELS)[label_idx],
+    }
+
+
+def calc_urgency_vec(arrs: AssignmentArrays, today: date) -> Dict[str, "np.ndarray"]:
+    dleft = arrs.due_ordinal - today.toordinal()
+    hours_day = arrs.estimated_hours / np.maximum(1, dleft)
+    # side="left" matches urgency_zone's bisect_left (<= thresholds)
+    zone_idx = np.searchsorted(ZONE_THRESHOLDS, hours_day, side="left")
+    return {
+        "overdue": dleft < 0,
+        "hours_per_day": _round2(hours_day),
+        "zone": np.array(ZONE_LABELS)[zone_idx],
+    }
+
+
+def danger_score_vec(risk_score: "np.ndarray", hours_per_day: "np.ndarray", overdue: "np.ndarray") -> "np.ndarray":
+    urgency_scaled = np.where(overdue, 10.0, np.minimum(5.0, hours_per_day) * 2.0)
+    return _round2((0.7 * risk_score) + (0.3 * urgency_scaled))
+
+
+def rank_assignments_by_danger_vec(arrs: AssignmentArrays, today: date, top_k: Optional[int] = None) -> List[Dict[str, object]]:
+    r = calc_risk_vec(arrs, today)
+    u = calc_urgency_vec(arrs, today)
+    danger = danger_score_vec(r["risk_score"], u["hours_per_day"], u["overdue"])
+
+    # stable, so ties keep input order exactly like list.sort(reverse=True)
+    order = np.argsort(-danger, kind="stable").tolist()
+    if top_k is not None:
+        order = order[:top_k]
+
+    risk_score = r["risk_score"].tolist()
+    risk_label = r["risk_label"].tolist()
+    overdue = u["overdue"].tolist()
+    zone = u["zone"].tolist()
+    hours_per_day = u["hours_per_day"].tolist()
+    danger_list = danger.tolist()
+    names = [a.name for a in arrs.assignments]
+
+    results: List[Dict[str, object]] = []
+    for i in order:
+        results.append({
+            "name": names[i],
+            "risk_score": risk_score[i],
+            "risk_label": risk_label[i],
+            "hours_per_day": None if overdue[i] else hours_per_day[i],
+            "zone": "Overdue" if overdue[i] else zone[i],
+            "danger_score": danger_list[i]
+        })
+    return results
+
+
+def stress_high_risk_names_vec(arrs: AssignmentArrays, today: date, window_days: int = 5) -> List[str]:
+    r = calc_risk_vec(arrs, today)
+    dleft = r["days_left"]
+    hit = (dleft >= 0) & (dleft <= window_days) & (r["risk_label"] == "High")
+    return [arrs.assignments[i].name for i in np.flatnonzero(hit).tolist()]
+
+
+def workload_projection_vec(arrs: AssignmentArrays, today: date, days: int = 7, with_breakdown: bool = True) -> List[Dict[str, object]]:
+    # days × N matrix: row i is "days left" for every assignment as of today + i
+    day_ord = today.toordinal() + np.arange(days)
+    dleft = arrs.due_ordinal[None, :] - day_ord[:, None]
+    due = dleft >= 0
+    daily = np.where(due, arrs.estimated_hours / np.maximum(1, dleft), 0.0)
+    # cumsum adds left to right like the scalar loop; .sum() would pair up
+    # terms and can land on a different last bit before rounding
+    totals = np.cumsum(daily, axis=1)[:, -1] if daily.shape[1] else np.zeros(days)
+    totals_list = _round2(totals).tolist()
+
+    if with_breakdown:
+        due_rows = [np.flatnonzero(row).tolist() for row in due]
+        daily_rounded = _round2(daily).tolist()
+        names = [a.name for a in arrs.assignments]
+        due_iso = [a.due_date.isoformat() for a in arrs.assignments]
+
+    projection: List[Dict[str, object]] = []
+    for i in range(days):
+        entry = {
+            "date": (today + timedelta(days=i)).isoformat(),
+            "total_hours": totals_list[i],
+        }
+        if with_breakdown:
+            hours_row = daily_rounded[i]
+            entry["breakdown"] = [
+                {"name": names[j], "daily_hours": hours_row[j], "due_date": due_iso[j]}
+                for j in due_rows[i]
+            ]
+        projection.append(entry)
+    return projection
+
+
+def gpa_impact_estimates_vec(arrs: AssignmentArrays, current_grade: float) -> List[Dict[str, object]]:
+    conf = arrs.confidence.astype(np.int64)
+    predicted = np.select(
+        [conf == 1, conf == 2, conf == 3, conf == 4, conf == 5],
+        [65.0, 75.0, 83.0, 90.0, 96.0],
+        83.0,
+    )
+    w = np.clip(arrs.weight_percent / 100.0, 0.0, 1.0)
+    grade = clamp(current_grade, 0.0, 100.0)
+    new_grade = _round2(grade * (1 - w) + np.clip(predicted, 0.0, 100.0) * w)
+    delta = _round2(new_grade - current_grade)
+
+    order = np.argsort(delta, kind="stable").tolist()
+    predicted_list = _round2(predicted).tolist()
+    new_grade_list = new_grade.tolist()
+    delta_list = delta.tolist()
+    current = round(current_grade, 2)
+
+    impacts: List[Dict[str, object]] = []
+    for i in order:
+        a = arrs.assignments[i]
+        d = delta_list[i]
+        drop_risk = bool(a.weight_percent >= 20 and a.confidence <= 2)
+
+        mag = abs(d)
+        if mag < 0.5:
+            severity = "Tiny"
+        elif mag < 1.5:
+            severity = "Noticeable"
+        else:
+            severity = "Big"
+
+        impacts.append({
+            "name": a.name,
+            "current_grade": current,
+            "weight_percent": a.weight_percent,
+            "predicted_score": predicted_list[i],
+            "projected_grade": new_grade_list[i],
+            "delta_points": d,
+            "severity": severity,
+            "drop_risk": drop_risk,
+            "message": (
+                f"Potential grade change: {d} points."
+                + (" ⚠️ High weight + low confidence." if drop_risk else "")
+            )
+        })
+    return impacts
@@ -0,0 +1,19 @@
+import multiprocessing
+import os
+
+# Production server settings, loaded by the Procfile:
+#   hypercorn --config file:hypercorn_conf.py app:app
+
+bind = [f"0.0.0.0:{os.environ.get('PORT', '5000')}"]
+
+# Each worker is its own event loop + executor; caches are keyed on the DB
+# revision, so running several side by side stays consistent.
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+worker_class = "asyncio"
+
+# Keep idle HTTP/1.1 connections open between dashboard polls so the
+# mobile client reuses its TCP/TLS session. HTTP/2 is negotiated
+# automatically (ALPN over TLS, or h2c upgrade) with no extra settings.
+keep_alive_timeout = 30
+
+accesslog = "-"
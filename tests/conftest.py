@@ -0,0 +1,30 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+# engine.py and app.py live at the repo root, not in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def app_module(tmp_path_factory):
+    """The app module, on a throwaway database (init_db runs at import)."""
+    pytest.importorskip("quart")
+    os.environ["DB_PATH"] = str(tmp_path_factory.mktemp("db") / "studentos.db")
+    os.environ.setdefault("JWT_SECRET_KEY", "test-secret-" + "x" * 32)
+    import app
+    assert app.DB_PATH == os.environ["DB_PATH"]
+    return app
+
+
+@pytest.fixture
+def run_client(app_module):
+    """Runs `await scenario(client)` against the app, serving hooks included."""
+    def run(scenario):
+        async def main():
+            async with app_module.app.test_app() as test_app:
+                return await scenario(test_app.test_client())
+        return asyncio.run(main())
+    return run
@@ -0,0 +1,130 @@
+"""
+/dashboard and /assignments answer If-None-Match from the user's revision
+(and the dashboard's server-side LRU is keyed on it), so every write that
+changes what they show must make an old tag stop matching.
+"""
+
+import itertools
+from datetime import date, timedelta
+
+import pytest
+
+_users = itertools.count()
+
+
+async def _login(client, prefix="user"):
+    username = f"{prefix}{next(_users)}"
+    r = await client.post("/register", json={"username": username, "password": "secret1"})
+    assert r.status_code == 200
+    return {"Authorization": "Bearer " + (await r.get_json())["access_token"]}
+
+
+async def _get(client, url, auth, etag=None):
+    headers = dict(auth)
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    r = await client.get(url, headers=headers)
+    return r.status_code, r.headers.get("ETag"), await r.get_data()
+
+
+async def _seed(client, auth):
+    r = await client.post("/courses", json={"name": "Calc"}, headers=auth)
+    course_id = (await r.get_json())["id"]
+    ids = []
+    for i, (name, weight, days, hours) in enumerate([("Midterm", 25, 2, 8), ("Essay", 15, 9, 10)]):
+        r = await client.post("/assignments", headers=auth, json={
+            "name": name,
+            "weightPercent": weight,
+            "dueDate": (date.today() + timedelta(days=days)).isoformat(),
+            "confidence": 2,
+            "estHours": hours,
+            "courseId": course_id if i == 0 else None,
+        })
+        ids.append((await r.get_json())["id"])
+    return course_id, ids
+
+
+# (request for the write, routes whose content it changes)
+WRITES = {
+    "create": (lambda c, a, ids, cid: c.post("/assignments", headers=a, json={
+        "name": "Quiz", "weightPercent": 5, "dueDate": (date.today() + timedelta(days=1)).isoformat(), "estHours": 3,
+    }), {"/assignments", "/dashboard"}),
+    "patch": (lambda c, a, ids, cid: c.patch(f"/assignments/{ids[0]}", headers=a, json={"estHours": 20}),
+              {"/assignments", "/dashboard"}),
+    "complete": (lambda c, a, ids, cid: c.post(f"/assignments/{ids[0]}/complete", headers=a),
+                 {"/assignments", "/dashboard"}),
+    "log-hours": (lambda c, a, ids, cid: c.post(f"/assignments/{ids[0]}/log-hours", headers=a, json={"hours": 2}),
+                  {"/assignments", "/dashboard"}),
+    "delete": (lambda c, a, ids, cid: c.delete(f"/assignments/{ids[0]}", headers=a),
+               {"/assignments", "/dashboard"}),
+    # unlinks courseId, which the dashboard doesn't show
+    "delete_course": (lambda c, a, ids, cid: c.delete(f"/courses/{cid}", headers=a), {"/assignments"}),
+    # the grade is part of the dashboard's cache key, not the revision
+    "settings_grade": (lambda c, a, ids, cid: c.post("/settings", headers=a, json={"current_grade": 71.5}),
+                       {"/dashboard"}),
+}
+
+
+@pytest.mark.parametrize("write", sorted(WRITES))
+def test_write_invalidates_cached_views(run_client, write):
+    do_write, changed = WRITES[write]
+
+    async def scenario(client):
+        auth = await _login(client)
+        course_id, ids = await _seed(client, auth)
+
+        before = {}
+        for url in ("/assignments", "/dashboard"):
+            status, etag, body = await _get(client, url, auth)
+            assert status == 200 and etag
+            assert (await _get(client, url, auth, etag))[0] == 304
+            before[url] = etag, body
+
+        r = await do_write(client, auth, ids, course_id)
+        assert r.status_code in (200, 204)
+
+        for url, (etag, body) in before.items():
+            status, new_etag, new_body = await _get(client, url, auth, etag)
+            if url in changed:
+                assert status == 200, url
+                assert new_etag != etag and new_body != body, url
+            else:
+                assert status == 304, url
+
+    run_client(scenario)
+
+
+def test_users_at_the_same_revision_get_different_assignment_tags(run_client):
+    async def scenario(client):
+        alice, bob = await _login(client, "alice"), await _login(client, "bob")
+
+        _, alice_tag, _ = await _get(client, "/assignments", alice)
+        _, bob_tag, _ = await _get(client, "/assignments", bob)
+        assert alice_tag != bob_tag
+
+        # bob's client replaying alice's tag must not get a 304 for his list
+        assert (await _get(client, "/assignments", bob, alice_tag))[0] == 200
+
+    run_client(scenario)
+
+
+@pytest.mark.parametrize("url", ["/assignments", "/dashboard"])
+def test_not_modified_matches_weak_tags_and_keeps_headers(run_client, url):
+    async def scenario(client):
+        auth = await _login(client)
+        await _seed(client, auth)
+        r = await client.get(url, headers=auth)
+        etag, cache_control = r.headers["ETag"], r.headers["Cache-Control"]
+
+        for tag in (etag, "W/" + etag, '"other", W/' + etag):
+            async with client.request(url, headers={**auth, "If-None-Match": tag}) as conn:
+                await conn.send_complete()
+                await conn.receive()
+            # raw headers: the test client's Response wrapper adds a default
+            # Content-Type that never went over the wire
+            assert conn.status_code == 304
+            assert conn.headers.get("ETag") == etag
+            assert conn.headers.get("Cache-Control") == cache_control
+            assert "Content-Type" not in conn.headers
+
+    run_client(scenario)
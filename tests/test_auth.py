@@ -0,0 +1,89 @@
+"""
+jwt_required / create_access_token on PyJWT. Tokens minted by the Flask
+app (flask-jwt-extended 4.x, identity in "sub") must keep working.
+"""
+
+import time
+import uuid
+
+import pytest
+
+jwt = pytest.importorskip("jwt")
+
+
+def _token(app_module, secret=None, **overrides):
+    # the claim set flask-jwt-extended 4.x put in an access token
+    now = int(time.time())
+    claims = {
+        "fresh": False,
+        "iat": now,
+        "jti": str(uuid.uuid4()),
+        "type": "access",
+        "sub": "flaskuser",
+        "nbf": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    claims = {k: v for k, v in claims.items() if v is not None}
+    return jwt.encode(claims, secret or app_module.app.config["JWT_SECRET_KEY"], algorithm="HS256")
+
+
+def _settings(run_client, authorization):
+    async def scenario(client):
+        headers = {} if authorization is None else {"Authorization": authorization}
+        r = await client.get("/settings", headers=headers)
+        return r.status_code, await r.get_json()
+
+    return run_client(scenario)
+
+
+def test_flask_jwt_extended_token_is_accepted(app_module, run_client):
+    status, body = _settings(run_client, "Bearer " + _token(app_module))
+    assert status == 200
+    assert body == {"current_grade": 85.0, "onboarded": False}
+
+
+def test_issued_token_round_trips(app_module, run_client):
+    async def scenario(client):
+        r = await client.post("/register", json={"username": "tokenuser", "password": "secret1"})
+        token = (await r.get_json())["access_token"]
+        r = await client.post("/settings", json={"current_grade": 90}, headers={"Authorization": "Bearer " + token})
+        return token, r.status_code
+
+    token, status = run_client(scenario)
+    assert status == 200
+    claims = jwt.decode(token, app_module.app.config["JWT_SECRET_KEY"], algorithms=["HS256"])
+    assert claims["sub"] == "tokenuser" and claims["type"] == "access"
+    assert _settings(run_client, "Bearer " + token) == (200, {"current_grade": 90.0, "onboarded": False})
+
+
+@pytest.mark.parametrize("authorization, status", [
+    (None, 401),
+    ("Token abc", 422),
+    ("Bearer", 422),
+    ("Bearer not.a.jwt", 422),
+])
+def test_bad_header(run_client, authorization, status):
+    assert _settings(run_client, authorization)[0] == status
+
+
+@pytest.mark.parametrize("case, status", [
+    ("expired", 401),
+    ("wrong_secret", 422),
+    ("refresh_token", 422),
+    ("no_sub", 422),
+    ("no_exp", 422),
+    ("identity_claim", 422),  # quart-jwt-extended's default claim name
+])
+def test_rejected_tokens(app_module, run_client, case, status):
+    token = {
+        "expired": lambda: _token(app_module, iat=1, nbf=1, exp=2),
+        "wrong_secret": lambda: _token(app_module, secret="another-secret-" + "y" * 32),
+        "refresh_token": lambda: _token(app_module, type="refresh"),
+        "no_sub": lambda: _token(app_module, sub=None),
+        "no_exp": lambda: _token(app_module, exp=None),
+        "identity_claim": lambda: _token(app_module, sub=None, identity="flaskuser"),
+    }[case]()
+    code, body = _settings(run_client, "Bearer " + token)
+    assert code == status
+    assert "msg" in body
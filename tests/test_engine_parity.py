@@ -0,0 +1,109 @@
+"""
+The NumPy path (engine section 10) must return exactly what the scalar
+code returns. These compare reprs, so a float that lands one bit off, or
+an int that turns into a float, fails.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+import engine
+
+np = pytest.importorskip("numpy")
+
+TODAY = date(2026, 10, 15)
+
+
+def random_assignments(rng, n):
+    # small name pool and integer hours/weights on purpose: duplicate names,
+    # tied danger scores and exact zone boundaries (e.g. 5 h over 2 days)
+    return [
+        engine.Assignment(
+            name=f"a{rng.randint(0, 9)}",
+            weight_percent=rng.choice([rng.uniform(-5, 120), rng.randint(0, 40), round(rng.uniform(0, 40), 1)]),
+            due_date=TODAY + timedelta(days=rng.randint(-5, 45)),
+            confidence=rng.randint(0, 6),
+            estimated_hours=rng.choice([rng.uniform(0, 30), rng.randint(0, 20), round(rng.uniform(0, 20), 1)]),
+        )
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_vectorized_path_matches_scalar(seed):
+    rng = random.Random(seed)
+    assignments = random_assignments(rng, rng.randint(0, 60))
+    arrays = engine.assignments_to_arrays(assignments, min_rows=0)
+    grade = rng.choice([85.0, rng.uniform(-10, 110)])
+    k = rng.randint(0, 5)
+
+    pairs = [
+        (engine.rank_assignments_by_danger, (assignments, TODAY), {}),
+        (engine.rank_assignments_by_danger, (assignments, TODAY), {"top_k": k}),
+        (engine.hours_next_days, (assignments, TODAY, 3), {}),
+        (engine.workload_projection, (assignments, TODAY, 7), {}),
+        (engine.workload_projection, (assignments, TODAY, 7), {"with_breakdown": False}),
+        (engine.gpa_impact_estimates, (assignments, grade), {}),
+        (engine.stress_forecast, (assignments, TODAY, 5), {}),
+        (engine.dashboard_summary, (assignments, TODAY), {}),
+    ]
+    for fn, args, kwargs in pairs:
+        scalar = fn(*args, **kwargs)
+        vectorized = fn(*args, arrays=arrays, **kwargs)
+        assert repr(vectorized) == repr(scalar), fn.__name__
+
+
+def test_round2_matches_round():
+    rng = random.Random(0)
+    # near-ties like 10 / 8 are where np.round(x, 2) and round(x, 2) differ
+    values = [rng.uniform(-50, 50) for _ in range(5000)]
+    values += [h / d for h in range(0, 41) for d in range(1, 41)]
+    values += [x / 1000 + 0.005 for x in range(-5000, 5000)]
+
+    out = engine._round2(np.array(values)).tolist()
+    assert out == [round(v, 2) for v in values]
+
+    grid = np.array(values[:6000]).reshape(60, 100)
+    assert engine._round2(grid).tolist() == [[round(v, 2) for v in row] for row in grid.tolist()]
+
+
+def _risk_inputs(seed, n=500):
+    rng = np.random.default_rng(seed)
+    dleft = rng.integers(-10, 40, n).astype(np.int64)
+    weight = np.concatenate([rng.uniform(-10, 130, n // 2), rng.integers(0, 40, n - n // 2).astype(np.float64)])
+    conf = rng.integers(-1, 8, n).astype(np.float64)
+    return dleft, weight, conf
+
+
+def _scalar_risk(dleft, weight, conf):
+    risk_score, labels = [], []
+    for d, w, c in zip(dleft.tolist(), weight.tolist(), conf.tolist()):
+        a = engine.Assignment("x", w, TODAY + timedelta(days=d), c, 0.0)
+        r = engine.calc_risk(a, TODAY)
+        risk_score.append(r["risk_score"])
+        labels.append(r["risk_label"])
+    return risk_score, labels
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [
+        engine._risk_kernel_np,
+        engine._risk_kernel_loop,   # the numba source, run as plain Python
+        pytest.param(
+            engine._risk_kernel,
+            marks=pytest.mark.skipif(engine.njit is None, reason="numba not installed"),
+            id="njit",
+        ),
+    ],
+)
+def test_risk_kernels_match_calc_risk(kernel):
+    for seed in range(5):
+        dleft, weight, conf = _risk_inputs(seed)
+        risk, label_idx = kernel(dleft, weight, conf)
+        expected_scores, expected_labels = _scalar_risk(dleft, weight, conf)
+
+        assert engine._round2(np.asarray(risk)).tolist() == expected_scores
+        assert [engine.RISK_LABELS[i] for i in label_idx.tolist()] == expected_labels
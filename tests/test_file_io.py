@@ -0,0 +1,77 @@
+"""
+save_assignments / load_assignments: what loads, and what it raises, must
+not depend on whether msgspec is installed.
+"""
+
+import json
+import math
+import os
+from datetime import date
+
+import pytest
+
+import engine
+
+BACKENDS = [
+    pytest.param(True, id="msgspec", marks=pytest.mark.skipif(engine.msgspec is None, reason="msgspec not installed")),
+    pytest.param(False, id="stdlib"),
+]
+
+
+@pytest.fixture
+def backend(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(engine, "msgspec", None)
+    engine._load_assignments_cached.cache_clear()
+    yield request.param
+    engine._load_assignments_cached.cache_clear()
+
+
+def _load_raw(tmp_path, text):
+    path = tmp_path / "assignments.json"
+    path.write_text(text)
+    engine._load_assignments_cached.cache_clear()
+    try:
+        return repr(engine.load_assignments(str(path)))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+@pytest.mark.parametrize("backend", BACKENDS, indirect=True)
+@pytest.mark.parametrize("weight, hours", [(float("nan"), 2.0), (10.0, float("inf")), (float("-inf"), float("nan"))])
+def test_non_finite_values_round_trip(tmp_path, backend, weight, hours):
+    path = str(tmp_path / "assignments.json")
+    engine.save_assignments(path, [engine.Assignment("x", weight, date(2026, 11, 1), 3, hours)])
+
+    (back,) = engine.load_assignments(path)
+    for got, want in ((back.weight_percent, weight), (back.estimated_hours, hours)):
+        assert got == want or (math.isnan(got) and math.isnan(want))
+
+
+@pytest.mark.parametrize("value", ['3', '3.0', '3.5', '1e1', '"3"', '"3.0"', '"1e1"', '" 3"', '"-0"', 'true', 'null', 'NaN'])
+@pytest.mark.parametrize("field", ["weight_percent", "confidence", "estimated_hours"])
+def test_same_result_with_and_without_msgspec(tmp_path, monkeypatch, field, value):
+    if engine.msgspec is None:
+        pytest.skip("msgspec not installed")
+    record = {"name": "a", "weight_percent": 10, "due_date": "2026-10-15", "confidence": 3, "estimated_hours": 2}
+    text = json.dumps([record]).replace(f'"{field}": {json.dumps(record[field])}', f'"{field}": {value}')
+
+    with_msgspec = _load_raw(tmp_path, text)
+    monkeypatch.setattr(engine, "msgspec", None)
+    assert _load_raw(tmp_path, text) == with_msgspec
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_save_keeps_or_derives_file_mode(tmp_path):
+    a = [engine.Assignment("x", 10.0, date(2026, 11, 1), 3, 2.0)]
+
+    new = tmp_path / "new.json"
+    engine.save_assignments(str(new), a)
+    reference = tmp_path / "reference.json"
+    reference.write_text("")  # what open(path, "w") creates under this umask
+    assert new.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777
+
+    new.chmod(0o640)
+    engine.save_assignments(str(new), a)
+    assert new.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
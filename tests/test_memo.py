@@ -0,0 +1,25 @@
+"""
+The memoized engine functions share their cached dicts process-wide;
+nothing a caller gets back may alias them.
+"""
+
+from datetime import date
+
+import engine
+
+TODAY = date(2026, 10, 15)
+A = engine.Assignment("Essay", 30, date(2026, 10, 17), 2, 9.0)
+
+
+def test_public_results_do_not_alias_the_cache():
+    engine.rank_assignments([A], TODAY)[0]["risk_score"] = -1
+    engine.urgency_curve(A, TODAY)[0]["zone"] = "tampered"
+    engine.dashboard_summary([A], TODAY)["top"][0]["start_by"]["message"] = "tampered"
+    engine.calc_risk(A, TODAY).clear()
+    engine.calc_urgency(A, TODAY).clear()
+    engine.start_by_date(A, TODAY).clear()
+
+    assert engine.calc_risk(A, TODAY)["risk_score"] != -1
+    assert engine.calc_urgency(A, TODAY)["zone"] == "Panic Zone"
+    assert engine.start_by_date(A, TODAY)["message"] != "tampered"
+    assert engine.rank_assignments_by_danger([A], TODAY)[0]["zone"] == "Panic Zone"
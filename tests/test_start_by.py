@@ -0,0 +1,41 @@
+"""
+_first_crunch_delay solves for the first crunching delay directly; it has
+to agree with the day-by-day scan start_by_date used to do, including on
+float boundaries (hours an exact multiple of the threshold).
+"""
+
+import random
+
+import pytest
+
+import engine
+
+
+def scan(hours, total_days_left, threshold):
+    for delay in range(total_days_left + 1):
+        if hours / max(1, total_days_left - delay) > threshold:
+            return delay
+    return None
+
+
+EDGE_HOURS = [0, 0.1, 1 / 3, 0.5, 1, 2, 2.5, 3, 4, 5, 7.5, 10, 12.5, 1e-9, 1e12,
+              float("inf"), float("nan"), -1, -5]
+EDGE_THRESHOLDS = [2.5, 1, 4, 0.1, 0.3, 1 / 3, 0, -0.5, -1]
+
+
+@pytest.mark.parametrize("threshold", EDGE_THRESHOLDS)
+def test_edge_values_match_scan(threshold):
+    for total in (1, 2, 3, 5, 10, 30, 365):
+        hours_list = EDGE_HOURS + [threshold * m + eps for m in range(1, total + 3) for eps in (0, 1e-12, -1e-12)]
+        for hours in hours_list:
+            assert engine._first_crunch_delay(hours, total, threshold) == scan(hours, total, threshold), (hours, total, threshold)
+
+
+def test_random_values_match_scan():
+    rng = random.Random(1)
+    for _ in range(20000):
+        total = rng.randint(1, 400)
+        threshold = rng.choice([2.5, rng.uniform(-2, 10)])
+        hours = rng.choice([rng.uniform(0, 100), round(rng.uniform(0, 50), 1), rng.randint(0, 60),
+                            threshold * rng.randint(1, total + 3)])
+        assert engine._first_crunch_delay(hours, total, threshold) == scan(hours, total, threshold), (hours, total, threshold)
@@ -0,0 +1,36 @@
+"""
+stress_forecast_combined fuses stress_forecast and stress_forecast_by_danger
+into one loop; it must return exactly what the two return separately.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+import engine
+
+TODAY = date(2026, 10, 15)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_combined_matches_separate_forecasts(seed):
+    rng = random.Random(seed)
+    assignments = [
+        engine.Assignment(
+            name=f"a{rng.randint(0, 9)}",
+            weight_percent=rng.choice([rng.uniform(-5, 120), rng.randint(0, 40)]),
+            due_date=TODAY + timedelta(days=rng.randint(-3, 12)),
+            confidence=rng.randint(0, 6),
+            estimated_hours=rng.choice([rng.uniform(0, 30), rng.randint(0, 20)]),
+        )
+        for _ in range(rng.randint(0, 40))
+    ]
+    window_days = rng.choice([5, rng.randint(-1, 14)])
+
+    combined = engine.stress_forecast_combined(assignments, TODAY, window_days)
+
+    assert combined == {
+        "by_risk": engine.stress_forecast(assignments, TODAY, window_days),
+        "by_zone": engine.stress_forecast_by_danger(assignments, TODAY, window_days),
+    }